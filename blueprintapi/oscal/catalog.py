@@ -1,9 +1,9 @@
 # mypy: ignore-errors
-import json
 import logging
 from pathlib import Path
 from typing import Literal, Optional, Union
 
+import orjson
 from pydantic import (  # pylint: disable=no-name-in-module
     UUID4,
     BaseModel,
@@ -225,7 +225,11 @@ class CatalogModel(BaseModel):
     @classmethod
     def from_json(cls, json_file: Union[str, Path]):
         with open(json_file, "rb") as file:
-            data = json.load(file)
+            return cls.from_bytes(file.read())
+
+    @classmethod
+    def from_bytes(cls, content: bytes):
+        data = orjson.loads(content)
 
         try:
             return cls(**data)
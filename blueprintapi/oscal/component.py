@@ -1,13 +1,15 @@
 # Define OSCAL Component using Component Definition Model v1.0.0
 # https://pages.nist.gov/OSCAL/reference/1.0.0/component-definition/json-outline/
 # mypy: ignore-errors
-import json
 from enum import Enum
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 from uuid import UUID, uuid4
 
-from pydantic import Field
+import orjson
+from pydantic import Field, PrivateAttr
 
 from blueprintapi.oscal.oscal import (
     BackMatter,
@@ -23,6 +25,8 @@ from blueprintapi.oscal.oscal import (
 )
 from catalogs.models import Catalog
 
+_VALID_VERSIONS = frozenset(Catalog.Version.values)
+
 
 class ComponentTypeEnum(str, Enum):
     software = "software"
@@ -38,6 +42,21 @@ class ComponentTypeEnum(str, Enum):
     validation = "validation"
 
 
+class IndexedElement(OSCALElement):
+    """An OSCAL element whose private attributes are lookup caches over its fields.
+
+    pydantic v1 carries private attributes over to copies, including the copy made
+    when a model is validated into another model. This overrides pydantic's private
+    _copy_and_set_values hook so each copy rebuilds its caches from its own fields,
+    and needs revisiting if pydantic is upgraded.
+    """
+
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        copied = super()._copy_and_set_values(values, fields_set, deep=deep)
+        copied._init_private_attributes()  # pylint: disable=protected-access
+        return copied
+
+
 class Statement(OSCALElement):
     statement_id: NCName
     uuid: UUID = Field(default_factory=uuid4)
@@ -55,7 +74,7 @@ class Statement(OSCALElement):
         allow_population_by_field_name = True
 
 
-class ImplementedRequirement(OSCALElement):
+class ImplementedRequirement(IndexedElement):
     uuid: UUID = Field(default_factory=uuid4)
     control_id: str
     description: MarkupMultiLine
@@ -66,16 +85,22 @@ class ImplementedRequirement(OSCALElement):
     statements: Optional[List[Statement]]
     remarks: Optional[MarkupMultiLine]
 
-    def _props_filter(self, name: str) -> Optional[str]:
-        if self.props is None:
-            return
-
-        property_ = next(filter(lambda prop: prop.name == name, self.props), None)
+    _props_index: Optional[Dict[str, str]] = PrivateAttr(default=None)
+    _statement_ids: Optional[Set[str]] = PrivateAttr(default=None)
+    _param_ids: Optional[Set[str]] = PrivateAttr(default=None)
 
-        if property_ is None:
-            return property_
+    @property
+    def _props_by_name(self) -> Dict[str, str]:
+        """Map of property name to value, built on first use."""
+        if self._props_index is None:
+            # Reversed so the first property with a given name wins.
+            self._props_index = {
+                prop.name: prop.value for prop in reversed(self.props or [])
+            }
+        return self._props_index
 
-        return property_.value
+    def _props_filter(self, name: str) -> Optional[str]:
+        return self._props_by_name.get(name)
 
     @property
     def responsibility(self) -> Optional[str]:
@@ -89,23 +114,33 @@ class ImplementedRequirement(OSCALElement):
         key = statement.statement_id
         if not self.statements:
             self.statements = []
-        elif key in self.statements:
+            self._statement_ids = set()
+        elif self._statement_ids is None:
+            self._statement_ids = {item.statement_id for item in self.statements}
+
+        if key in self._statement_ids:
             raise KeyError(
                 f"Statement {key} already in ImplementedRequirement"
-                " for {self.control_id}"
+                f" for {self.control_id}"
             )
+        self._statement_ids.add(key)
         self.statements.append(statement)
         return self
 
     def add_parameter(self, set_parameter: Parameter):
-        key = set_parameter.param_id
+        key = set_parameter.id
         if not self.set_parameters:
             self.set_parameters = []
-        elif key in self.set_parameters:
+            self._param_ids = set()
+        elif self._param_ids is None:
+            self._param_ids = {item.id for item in self.set_parameters}
+
+        if key in self._param_ids:
             raise KeyError(
                 f"SetParameter {key} already in ImplementedRequirement"
-                " for {self.control_id}"
+                f" for {self.control_id}"
             )
+        self._param_ids.add(key)
         self.set_parameters.append(set_parameter)
         return self
 
@@ -113,11 +148,14 @@ class ImplementedRequirement(OSCALElement):
         key = property.name
         if not self.props:
             self.props = []
-        elif key in self.props:
+            self._props_index = {}
+
+        if key in self._props_by_name:
             raise KeyError(
                 f"Property {key} already in ImplementedRequirement"
-                " for {self.control_id}"
+                f" for {self.control_id}"
             )
+        self._props_by_name[key] = property.value
         self.props.append(property)
         return self
 
@@ -144,12 +182,22 @@ class ControlImplementation(OSCALElement):
         fields = {"implemented_requirements": "implemented-requirements"}
         allow_population_by_field_name = True
 
+    def get_requirement(self, control_id: str) -> Optional[ImplementedRequirement]:
+        return next(
+            (
+                requirement
+                for requirement in self.implemented_requirements
+                if requirement.control_id == control_id
+            ),
+            None,
+        )
+
 
 class Protocol(OSCALElement):
     pass
 
 
-class Component(OSCALElement):
+class Component(IndexedElement):
     uuid: UUID = Field(default_factory=uuid4)
     type: ComponentTypeEnum = ComponentTypeEnum.software
     title: MarkupLine
@@ -171,66 +219,73 @@ class Component(OSCALElement):
         allow_population_by_field_name = True
         exclude_if_false = ["control-implementations"]
 
+    _implementations: Optional[Dict[str, ControlImplementation]] = PrivateAttr(
+        default=None
+    )
+
+    def _invalidate_indexes(self):
+        """Drop the cached implementation lookup after the implementations change."""
+        self._implementations = None
+
+    def add_control_implementation(self, implementation: ControlImplementation):
+        self.control_implementations.append(implementation)
+        self._invalidate_indexes()
+        return self
+
     def get_control_implementation(self, catalog_version: str) -> ControlImplementation:
-        try:
-            return next(
-                filter(
-                    lambda imp: imp.description == catalog_version,
-                    self.control_implementations,
+        if self._implementations is None:
+            self._implementations = {}
+            for implementation in self.control_implementations:
+                self._implementations.setdefault(
+                    implementation.description, implementation
                 )
-            )
-        except StopIteration as exc:
+
+        try:
+            return self._implementations[catalog_version]
+        except KeyError as exc:
             raise KeyError(
                 f"Provided catalog version is not in control implementations: '{catalog_version}'."
             ) from exc
 
     @property
     def control_ids(self) -> List[str]:
-        return list(
-            {
-                item.control_id
-                for implementation in self.control_implementations
-                for item in implementation.implemented_requirements
-            }
-        )
+        return list({item.control_id for item in self.controls()})
 
     def controls(self, catalog_version: str = None) -> List[ImplementedRequirement]:
         if not catalog_version:
-            return [
-                item
-                for implementation in self.control_implementations
-                for item in implementation.implemented_requirements
-            ]
+            return list(
+                chain.from_iterable(
+                    map(
+                        attrgetter("implemented_requirements"),
+                        self.control_implementations,
+                    )
+                )
+            )
 
-        return self.get_control_implementation(catalog_version).implemented_requirements
+        return list(
+            self.get_control_implementation(catalog_version).implemented_requirements
+        )
 
     def get_control(
         self, control_id: str, catalog_version: str
     ) -> ImplementedRequirement:
         implementation = self.get_control_implementation(catalog_version)
+        requirement = implementation.get_requirement(control_id)
 
-        try:
-            return next(
-                filter(
-                    lambda req: req.control_id == control_id,
-                    implementation.implemented_requirements,
-                )
-            )
-        except StopIteration as exc:
-            raise KeyError(
-                f"{control_id} is not implemented in this component."
-            ) from exc
+        if requirement is None:
+            raise KeyError(f"{control_id} is not implemented in this component.")
+
+        return requirement
 
     @property
     def catalog_versions(self) -> List[Catalog.Version]:
-        versions = set()
-        for item in self.control_implementations:
-            try:
-                versions.add(Catalog.Version(item.description))
-            except ValueError:
-                continue
-
-        return list(versions)
+        return list(
+            {
+                Catalog.Version(item.description)
+                for item in self.control_implementations
+                if item.description in _VALID_VERSIONS
+            }
+        )
 
 
 class IncorporatesComponent(OSCALElement):
@@ -261,7 +316,7 @@ class ImportComponentDefinition(OSCALElement):
     href: str  # really uri-reference
 
 
-class ComponentDefinition(OSCALElement):
+class ComponentDefinition(IndexedElement):
     uuid: UUID = Field(default_factory=uuid4)
     metadata: Metadata
     components: Optional[List[Component]]
@@ -269,13 +324,21 @@ class ComponentDefinition(OSCALElement):
     capabilities: Optional[List[Capability]]
     import_component_definitions: Optional[List[ImportComponentDefinition]]
 
+    _component_uuids: Optional[Set[str]] = PrivateAttr(default=None)
+    _capability_uuids: Optional[Set[str]] = PrivateAttr(default=None)
+
     def add_component(self, component: Component):
         key = str(component.uuid)
         # initialize optional component list
         if not self.components:
             self.components = []
-        elif key in self.components:
+            self._component_uuids = set()
+        elif self._component_uuids is None:
+            self._component_uuids = {str(item.uuid) for item in self.components}
+
+        if key in self._component_uuids:
             raise KeyError(f"Component {key} already in ComponentDefinition")
+        self._component_uuids.add(key)
         self.components.append(component)
         return self
 
@@ -284,8 +347,13 @@ class ComponentDefinition(OSCALElement):
         # initialize optional capability list
         if not self.capabilities:
             self.capabilities = []
-        elif key in self.capabilities:
+            self._capability_uuids = set()
+        elif self._capability_uuids is None:
+            self._capability_uuids = {str(item.uuid) for item in self.capabilities}
+
+        if key in self._capability_uuids:
             raise KeyError(f"Capability {key} already in ComponentDefinition")
+        self._capability_uuids.add(key)
         self.capabilities.append(capability)
         return self
 
@@ -307,8 +375,8 @@ class ComponentModel(OSCALElement):
 
     @classmethod
     def from_json(cls, json_file: Union[str, Path]):
-        with open(json_file) as data:
-            return cls(**json.load(data))
+        with open(json_file, "rb") as data:
+            return cls.parse_obj(orjson.loads(data.read()))
 
     @classmethod
     def list_components(cls):
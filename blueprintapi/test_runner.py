@@ -0,0 +1,23 @@
+import shutil
+import tempfile
+
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+
+class TemporaryMediaTestRunner(DiscoverRunner):
+    """Store files uploaded during tests, like catalog copies, in a temporary MEDIA_ROOT."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._media_root = tempfile.mkdtemp(prefix="blueprint-media-")
+        self._media_settings = override_settings(MEDIA_ROOT=self._media_root)
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._media_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._media_settings.disable()
+        shutil.rmtree(self._media_root, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
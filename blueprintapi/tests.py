@@ -2,13 +2,23 @@ import json
 import os
 import tempfile
 import time
+from uuid import uuid4
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
-from blueprintapi.oscal.component import ComponentModel
+from blueprintapi.oscal.component import (
+    ComponentDefinition,
+    ComponentModel,
+    ControlImplementation,
+    ImplementedRequirement,
+    Statement,
+)
+from blueprintapi.oscal.oscal import Parameter, Property
+from catalogs.models import Catalog
+from testing_utils import FAST_PASSWORD_HASHERS
 from users.models import User
 
 
@@ -37,6 +47,7 @@ class UnauthenticatedAPITestCase(APITestCase):
             with self.assertRaises(Token.DoesNotExist):
                 Token.objects.get(user=user)
 
+    @override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
     def test_expired_token_is_refreshed_on_successful_auth(self):
         login = json.dumps({"username": "test", "password": "SuperSecretPassword"})
 
@@ -178,3 +189,159 @@ class ComponentModelTestCase(SimpleTestCase):
             sorted(component.component_definition.components[0].control_ids),
             ["ac-11", "ac-3", "ac-7"],
         )
+
+    def test_requirement_props(self):
+        component = ComponentModel(**COMPONENT_DATA).component_definition.components[0]
+        requirement = component.get_control("ac-3", catalog_version="NIST_SP80053r5")
+
+        self.assertEqual(requirement.responsibility, "Hybrid")
+        self.assertIsNone(requirement.provider)
+
+        requirement.add_property(Property(name="provider", value="AWS"))
+        self.assertEqual(requirement.provider, "AWS")
+
+    def test_requirement_rejects_duplicates(self):
+        requirement = ImplementedRequirement(control_id="ac-2", description="test")
+        requirement.add_statement(Statement(statement_id="ac-2_smt.a"))
+        requirement.add_parameter(Parameter(id="ac-02_odp.01"))
+
+        with self.assertRaises(KeyError):
+            requirement.add_statement(Statement(statement_id="ac-2_smt.a"))
+
+        with self.assertRaises(KeyError):
+            requirement.add_parameter(Parameter(id="ac-02_odp.01"))
+
+        self.assertEqual(len(requirement.statements), 1)
+        self.assertEqual(len(requirement.set_parameters), 1)
+
+    def test_requirement_rejects_loaded_duplicates(self):
+        requirement = ImplementedRequirement(
+            control_id="ac-2",
+            description="test",
+            props=[{"name": "security_control_type", "value": "Hybrid"}],
+            statements=[{"statement-id": "ac-2_smt.a"}],
+        )
+
+        with self.assertRaises(KeyError):
+            requirement.add_statement(Statement(statement_id="ac-2_smt.a"))
+
+        with self.assertRaises(KeyError):
+            requirement.add_property(
+                Property(name="security_control_type", value="Inherited")
+            )
+
+        requirement.add_statement(Statement(statement_id="ac-2_smt.b"))
+        self.assertEqual(len(requirement.statements), 2)
+        self.assertEqual(requirement.responsibility, "Hybrid")
+
+    def test_definition_rejects_loaded_component(self):
+        definition = ComponentModel(**COMPONENT_DATA).component_definition
+        loaded = definition.components[0]
+
+        with self.assertRaises(KeyError):
+            definition.add_component(loaded.copy())
+
+        definition.add_component(loaded.copy(update={"uuid": uuid4()}))
+        self.assertEqual(len(definition.components), 2)
+
+    def test_control_ids_after_adding_implementation(self):
+        component = ComponentModel(**COMPONENT_DATA).component_definition.components[0]
+        self.assertEqual(len(component.controls()), 3)
+
+        component.add_control_implementation(
+            ControlImplementation(
+                source="https://raw.githubusercontent.com/NIST/catalog.json",
+                description="NIST_SP80053r4",
+                implemented_requirements=[
+                    ImplementedRequirement(control_id="ac-2", description="test")
+                ],
+            )
+        )
+
+        self.assertEqual(
+            sorted(component.control_ids), ["ac-11", "ac-2", "ac-3", "ac-7"]
+        )
+        self.assertEqual(len(component.controls()), 4)
+        self.assertEqual(len(component.controls("NIST_SP80053r4")), 1)
+
+    def test_lookups_after_appending_requirement(self):
+        component = ComponentModel(**COMPONENT_DATA).component_definition.components[0]
+        self.assertEqual(sorted(component.control_ids), ["ac-11", "ac-3", "ac-7"])
+        self.assertEqual(len(component.controls()), 3)
+        with self.assertRaises(KeyError):
+            component.get_control("ac-2", catalog_version="NIST_SP80053r5")
+
+        component.get_control_implementation(
+            "NIST_SP80053r5"
+        ).implemented_requirements.append(
+            ImplementedRequirement(control_id="ac-2", description="test")
+        )
+
+        self.assertEqual(
+            sorted(component.control_ids), ["ac-11", "ac-2", "ac-3", "ac-7"]
+        )
+        self.assertEqual(len(component.controls()), 4)
+        self.assertEqual(len(component.controls("NIST_SP80053r5")), 4)
+        self.assertEqual(
+            component.get_control("ac-2", catalog_version="NIST_SP80053r5").control_id,
+            "ac-2",
+        )
+
+    def test_copies_rebuild_lookups(self):
+        definition = ComponentModel(**COMPONENT_DATA).component_definition
+        component = definition.components[0]
+        self.assertEqual(len(component.controls()), 3)
+
+        emptied = component.copy(update={"control_implementations": []})
+        self.assertEqual(emptied.control_ids, [])
+        self.assertEqual(emptied.controls(), [])
+
+        # Validation copies the component into the new definition.
+        copied = ComponentDefinition(
+            metadata=definition.metadata, components=[component]
+        ).components[0]
+        component.add_control_implementation(
+            ControlImplementation(
+                source="https://raw.githubusercontent.com/NIST/catalog.json",
+                description="NIST_SP80053r4",
+                implemented_requirements=[
+                    ImplementedRequirement(control_id="ac-2", description="test")
+                ],
+            )
+        )
+        self.assertEqual(len(copied.controls()), 4)
+
+        requirement = component.get_control("ac-3", catalog_version="NIST_SP80053r5")
+        self.assertEqual(requirement.responsibility, "Hybrid")
+        self.assertIsNone(requirement.copy(update={"props": []}).responsibility)
+
+    def test_controls_returns_new_list(self):
+        component = ComponentModel(**COMPONENT_DATA).component_definition.components[0]
+        component.controls().clear()
+        component.controls("NIST_SP80053r5").clear()
+
+        self.assertEqual(len(component.controls()), 3)
+        self.assertEqual(len(component.controls("NIST_SP80053r5")), 3)
+
+    def test_catalog_versions(self):
+        component = ComponentModel(**COMPONENT_DATA).component_definition.components[0]
+        component.add_control_implementation(
+            ControlImplementation(
+                source="https://example.com/catalog.json",
+                description="Not a catalog version",
+            )
+        )
+
+        self.assertEqual(component.catalog_versions, [Catalog.Version.NIST_SP80053R5])
+
+    def test_get_control(self):
+        component = ComponentModel(**COMPONENT_DATA).component_definition.components[0]
+
+        control = component.get_control("ac-7", catalog_version="NIST_SP80053r5")
+        self.assertEqual(str(control.uuid), "c6f3a55d-e6aa-4ea1-9892-43336a665b6a")
+
+        with self.assertRaises(KeyError):
+            component.get_control("ac-2", catalog_version="NIST_SP80053r5")
+
+        with self.assertRaises(KeyError):
+            component.get_control("ac-7", catalog_version="NIST_SP80053r4")
@@ -1,6 +1,6 @@
 import re
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, Optional, Set, Tuple
 
 from django.core.files import File
 from django.core.management.base import BaseCommand, CommandError
@@ -35,8 +35,24 @@ class Command(BaseCommand):
 
             self._load_catalog(input_file, name, **create_kwargs)
 
-    def _load_catalog(self, input_file: Path, name: str, **catalog_args):
-        if Catalog.objects.filter(name=name).exists():
+    @staticmethod
+    def _loaded_names(names: Iterable[str]) -> Set[str]:
+        """Return which of the given catalog names are already in the database."""
+        return set(
+            Catalog.objects.filter(name__in=names).values_list("name", flat=True)
+        )
+
+    def _load_catalog(
+        self,
+        input_file: Path,
+        name: str,
+        loaded: Optional[Set[str]] = None,
+        **catalog_args,
+    ):
+        if loaded is None:
+            loaded = self._loaded_names([name])
+
+        if name in loaded:
             self.stdout.write(
                 self.style.WARNING(
                     f"Catalog, {name} has already been loaded. Skipping."
@@ -77,12 +93,15 @@ class Command(BaseCommand):
             self._parse_standard_catalog_path(path) for path in catalog_files
         ]
         base_path = "https://raw.githubusercontent.com/usnistgov/oscal-content/main/nist.gov/SP800-53"
+        # Look up every existing catalog in one query instead of one per file.
+        loaded = self._loaded_names(name for _, _, name, _ in catalog_defs)
         for (version, impact_level, name, source), file in zip(
             catalog_defs, catalog_files
         ):
             self._load_catalog(
                 input_file=file.relative_to(file.parents[4]),
                 name=name,
+                loaded=loaded,
                 version=source,
                 impact_level=impact_level,
                 source=f"{base_path}/{version}/json/{source}_catalog.json",
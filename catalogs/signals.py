@@ -1,19 +1,45 @@
+import hashlib
 import os
+from typing import Dict, Tuple
 
 from blueprintapi.oscal.catalog import CatalogModel
 from catalogs.models import Catalog, Controls
 
+# Six standard catalogs plus the test catalog.
+MAX_CACHED_CATALOGS = 7
+
+_catalog_controls_cache: Dict[bytes, Tuple[dict, ...]] = {}
+
+
+def catalog_controls(path: str) -> Tuple[dict, ...]:
+    """
+    Return the Controls field values for the catalog file at path.
+    Stored copies of a catalog get unique names, so rows are cached on a sha256 digest of the content.
+    """
+    with open(path, "rb") as file:
+        content = file.read()
+    digest = hashlib.sha256(content).digest()
+
+    if digest not in _catalog_controls_cache:
+        if len(_catalog_controls_cache) >= MAX_CACHED_CATALOGS:
+            del _catalog_controls_cache[next(iter(_catalog_controls_cache))]
+        catalog_data = CatalogModel.from_bytes(content)
+        _catalog_controls_cache[digest] = tuple(
+            item.to_orm() for item in catalog_data.controls
+        )
+
+    return _catalog_controls_cache[digest]
+
 
 # noinspection PyUnusedLocal
 def add_controls(
     sender, instance: Catalog, created: bool, **kwargs
 ):  # pylint: disable=unused-argument
     if created:
-        catalog_data = CatalogModel.from_json(instance.file_name.path)
         Controls.objects.bulk_create(
             [
-                Controls(**{"catalog": instance, **item.to_orm()})
-                for item in catalog_data.controls
+                Controls(**{"catalog": instance, **item})
+                for item in catalog_controls(instance.file_name.path)
             ]
         )
 
@@ -36,8 +62,13 @@ def auto_delete_file_on_change(
     if not instance.pk:
         return False
 
+    # Saves that don't touch the file can't have replaced it.
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "file_name" not in update_fields:
+        return False
+
     try:
-        old_file = Catalog.objects.get(pk=instance.pk).file_name
+        old_file = Catalog.objects.only("file_name").get(pk=instance.pk).file_name
     except Catalog.DoesNotExist:
         return False
 
@@ -1,11 +1,15 @@
+import os
+
 from django.core.files import File
 from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
 
+from blueprintapi.oscal.catalog import CatalogModel
 from catalogs.catalogio import CatalogTools as Tools
 from catalogs.models import Catalog, Controls
+from catalogs.signals import catalog_controls
 from testing_utils import AuthenticatedAPITestCase, prevent_request_warnings
 
 
@@ -29,6 +33,25 @@ class CatalogModelTest(AuthenticatedAPITestCase):
         cat_title = catalog.catalog_title
         self.assertEqual(cat_title, title)
 
+    def test_catalog_controls_cached_by_content(self):
+        # The stored copy has a different name from the original test data file.
+        original = catalog_controls(
+            "blueprintapi/testdata/NIST_SP-800-53_rev5_test.json"
+        )
+        self.assertIs(catalog_controls(self.cat.file_name.path), original)
+
+    def test_catalog_model_not_shared(self):
+        path = self.cat.file_name.path
+        self.assertIsNot(CatalogModel.from_json(path), CatalogModel.from_json(path))
+
+    def test_save_without_file_skips_file_lookup(self):
+        self.cat.name = "Renamed Test Catalog"
+
+        with self.assertNumQueries(1):
+            self.cat.save(update_fields=["name"])
+
+        self.assertTrue(os.path.isfile(self.cat.file_name.path))
+
     def test_get_control_by_id(self):
         cid = self.cat.id
         response = self.client.get(
@@ -78,6 +101,9 @@ class LoadCatalogCommandTestCase(TestCase):
 
     def test_existing_catalogs_are_skipped(self):
         call_command("load_catalog", load_standard_catalogs=True)
-        call_command("load_catalog", load_standard_catalogs=True)
+
+        # Existing catalogs are found with a single lookup.
+        with self.assertNumQueries(1):
+            call_command("load_catalog", load_standard_catalogs=True)
 
         self.assertEqual(Catalog.objects.count(), 6)
@@ -92,7 +92,7 @@ def create_empty_component_json(
         description=title,
         type="software",
     )
-    component.control_implementations.append(control_implementation)
+    component.add_control_implementation(control_implementation)
 
     component_definition = oscal_component.ComponentDefinition(
         metadata=Metadata(title=title, version="unknown")
@@ -12,7 +12,11 @@ from catalogs.models import Catalog
 from components.componentio import ComponentTools, create_empty_component_json
 from components.models import Component
 from components.serializers import ComponentListSerializer, ComponentSerializer
-from testing_utils import AuthenticatedAPITestCase, prevent_request_warnings
+from testing_utils import (
+    AuthenticatedAPITestCase,
+    StandardCatalogsMixin,
+    prevent_request_warnings,
+)
 from users.models import User
 
 TEST_COMPONENT_JSON_BLOB = {
@@ -614,11 +618,7 @@ class ComponentImplementedRequirementViewTest(AuthenticatedAPITestCase):
                 self.assertEqual(implemented.get("control-id"), test_control_id)
 
 
-class LoadComponentsTestCase(TestCase):
-    @classmethod
-    def setUpTestData(cls):
-        call_command("load_catalog", load_standard_catalogs=True)
-
+class LoadComponentsTestCase(StandardCatalogsMixin, TestCase):
     def test_load_test_components(self):
         call_command("load_components")
 
@@ -1,6 +1,9 @@
 import re
 import uuid
-from typing import List
+from typing import Dict, List
+
+import orjson
+from pydantic.json import pydantic_encoder  # pylint: disable=no-name-in-module
 
 from blueprintapi.oscal.oscal import Metadata, Property, Resource
 from blueprintapi.oscal.ssp import (
@@ -27,11 +30,25 @@ from blueprintapi.oscal.ssp import (
 from components.componentio import ComponentTools
 from projects.models import Project
 
+SHORT_NAME_PATTERN = re.compile(r"\((.*?)\)")
+SSP_OSCAL_VERSION = "1.0.2"
+# Only ever serialized, so every component can share one status.
+OPERATIONAL_STATUS = SystemStatus.construct(state="operational")
+
 
+# pylint: disable=too-many-instance-attributes
 class OscalSSP:
     def __init__(self, project: Project, extras: str):
         self.project = project
         self.extras = extras
+        self._fips = f"fips-199-{project.impact_level}"
+        # Fetch the project's components and controls once for every section.
+        self._components = list(
+            project.components.all().only(
+                "status", "title", "type", "description", "component_json"
+            )
+        )
+        self._controls = list(project.controls.all().only("control_id"))
         self.metadata = None
         self.set_metadata()
         self.users: List = []
@@ -42,7 +59,7 @@ class OscalSSP:
         self.control_implementations = None
         self.add_implemented_requirements()
 
-    def get_ssp(self):
+    def get_ssp(self) -> bytes:
         ssp = SystemSecurityPlan(
             metadata=self.metadata,
             import_profile=self.get_import_profile(),
@@ -52,24 +69,30 @@ class OscalSSP:
             back_matter=self.get_back_matter(),
         )
         root = Model(system_security_plan=ssp)
-        return root.json(indent=2)
+        # Equivalent JSON document. orjson returns UTF-8 bytes, so the download's
+        # Content-Length is the byte length, even for non-ASCII project titles.
+        return orjson.dumps(
+            root.dict(by_alias=True, exclude_none=True),
+            default=pydantic_encoder,
+            option=orjson.OPT_INDENT_2,
+        )
 
     def set_metadata(self):
         self.metadata = Metadata(
             title=self.project.title,
             version="0.1",
-            oscal_version="1.0.2",
+            oscal_version=SSP_OSCAL_VERSION,
         )
 
     def set_roles(self):
         self.metadata.roles = []
-        ids = []
+        ids = set()
         properties = None
-        for stakeholder in self.extras.get("stakeholders"):
+        stakeholders = self.extras.get("stakeholders") or []
+        for stakeholder in stakeholders:
             title, short_name, role_id = "", "", ""
             for key, value in stakeholder.items():
-                if re.search(r"\((.*?)\)", key):
-                    short = re.search(r"\((.*?)\)", key)
+                if short := SHORT_NAME_PATTERN.search(key):
                     short_name = short.group(1)
                     title = key[: key.find(" (")]
                 else:
@@ -83,7 +106,7 @@ class OscalSSP:
                 )
             role_id = title.replace(" ", "-").lower()
             if title and role_id not in ids:
-                ids.append(role_id)
+                ids.add(role_id)
                 self.users.append(
                     User(
                         role_ids=[role_id],
@@ -93,7 +116,7 @@ class OscalSSP:
                     )
                 )
                 self.metadata.roles.append(
-                    Role(
+                    Role.construct(
                         title=title.strip(),
                         short_name=short_name.upper(),
                         id=role_id,
@@ -101,32 +124,35 @@ class OscalSSP:
                 )
 
     def get_impact_level(self):
-        return SecurityImpactLevel(
-            security_objective_confidentiality=f"fips-199-{self.project.impact_level}",
-            security_objective_availability=f"fips-199-{self.project.impact_level}",
-            security_objective_integrity=f"fips-199-{self.project.impact_level}",
+        return SecurityImpactLevel.construct(
+            security_objective_confidentiality=self._fips,
+            security_objective_availability=self._fips,
+            security_objective_integrity=self._fips,
         )
 
     def get_import_profile(self):
         return ImportProfile(href=self.project.catalog.source)
 
     def get_information_type(self):
-        return InformationType(
+        # All three objectives share the project's impact level.
+        impact = Impact.construct(base=self._fips)
+        return InformationType.construct(
             title=self.project.title,
             description=self.project.title,
-            confidentiality_impact=Impact(base=f"fips-199-{self.project.impact_level}"),
-            integrity_impact=Impact(base=f"fips-199-{self.project.impact_level}"),
-            availability_impact=Impact(base=f"fips-199-{self.project.impact_level}"),
+            confidentiality_impact=impact,
+            integrity_impact=impact,
+            availability_impact=impact,
         )
 
     def get_system_information(self):
         information_type = self.get_information_type()
-        return SystemInformation(information_types=[information_type])
+        return SystemInformation.construct(information_types=[information_type])
 
     def get_system_characteristics(self):
-        return SystemCharacteristics(
+        # Built from our own database values, so skip pydantic validation.
+        return SystemCharacteristics.construct(
             system_ids=[
-                SystemId(
+                SystemId.construct(
                     id=uuid.uuid5(uuid.NAMESPACE_OID, self.project.title),
                     identifier_type="https://ietf.org/rfc/rfc4122",
                 )
@@ -136,29 +162,29 @@ class OscalSSP:
             security_sensitivity_level=self.project.impact_level,
             system_information=self.get_system_information(),
             security_impact_level=self.get_impact_level(),
-            authorization_boundary=NetworkDiagram(
+            authorization_boundary=NetworkDiagram.construct(
                 description="INSERT AUTHORIZATION BOUNDARY"
             ),
-            status=SystemStatus(state="operational"),
+            status=OPERATIONAL_STATUS,
         )
 
     def add_components(self):
         self.system_implementation = SystemImplementation()
         self.system_implementation.users = self.users
-        for component in self.project.components.all():
+        this_system = {
+            "title": "This System",
+            "type": "this-system",
+            "description": self.project.title,
+        }
+        for component in self._components:
             if component.status == 1:
-                cpt = Component(
-                    title="This System",
-                    type="this-system",
-                    description=self.project.title,
-                    status=SystemStatus(state="operational"),
-                )
+                cpt = Component.construct(status=OPERATIONAL_STATUS, **this_system)
             else:
-                cpt = Component(
+                cpt = Component.construct(
                     title=component.title,
                     type=component.type,
                     description=component.description,
-                    status=SystemStatus(state="operational"),
+                    status=OPERATIONAL_STATUS,
                 )
             self.system_implementation.add_component(cpt)
             self.component_ref[component.title] = cpt.uuid
@@ -167,24 +193,37 @@ class OscalSSP:
         self.control_implementations = ControlImplementation(
             description="[INSERT SYSTEM DESCRIPTION HERE]", implemented_requirements=[]
         )
-        for control in self.project.controls.all():
+        # Parse each component once instead of once per project control.
+        components = [
+            (component.title, self._controls_by_id(component.component_json))
+            for component in self._components
+        ]
+        for control in self._controls:
             implemented_requirement = ImplementedRequirement(
                 control_id=control.control_id,
             )
-            for component in self.project.components.all():
-                cmp = ComponentTools(component.component_json)
-                if control.control_id in component.controls:
-                    ctrl = cmp.get_control_by_id(control.control_id)
+            for title, controls in components:
+                if ctrl := controls.get(control.control_id):
                     implemented_requirement.add_by_component(
                         ByComponent(
-                            component_uuid=self.component_ref[component.title],
-                            description=ctrl[0].get("description"),
+                            component_uuid=self.component_ref[title],
+                            description=ctrl.get("description"),
                         )
                     )
-                    self.control_implementations.implemented_requirements.append(
-                        implemented_requirement
-                    )
+            if implemented_requirement.by_components:
+                self.control_implementations.implemented_requirements.append(
+                    implemented_requirement
+                )
+
+    @staticmethod
+    def _controls_by_id(component_json: dict) -> Dict[str, dict]:
+        controls: Dict[str, dict] = {}
+        for control in ComponentTools(component_json).get_controls():
+            controls.setdefault(control.get("control-id"), control)
+        return controls
 
     @staticmethod
     def get_back_matter():
-        return BackMatter(resources=[Resource(title="Test Resource")])
+        return BackMatter.construct(
+            resources=[Resource.construct(title="Test Resource")]
+        )
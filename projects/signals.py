@@ -17,12 +17,19 @@ logger = logging.getLogger(__name__)
 
 
 def _add_project_controls(instance: Project):
-    catalog_controls = Controls.objects.filter(catalog_id=instance.catalog)
-    if catalog_controls.exists():
-        instance.controls.set(
-            catalog_controls,
-            through_defaults={"status": ProjectControl.Status.NOT_STARTED},
+    # A new project has no controls yet, so insert the rows directly rather than
+    # letting controls.set() diff them against the existing ones.
+    control_ids = Controls.objects.filter(catalog_id=instance.catalog).values_list(
+        "id", flat=True
+    )
+    ProjectControl.objects.bulk_create(
+        ProjectControl(
+            project=instance,
+            control_id=control_id,
+            status=ProjectControl.Status.NOT_STARTED,
         )
+        for control_id in control_ids
+    )
 
 
 def _add_default_component(instance: Project, group: Group):
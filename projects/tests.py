@@ -1,15 +1,20 @@
 import json
 
-from django.core.management import call_command
+import orjson
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 
 from catalogs.models import Catalog
+from components.componentio import ComponentTools
 from components.models import Component
 from projects.models import Project, ProjectControl
-from testing_utils import AuthenticatedAPITestCase
+from testing_utils import (
+    AuthenticatedAPITestCase,
+    StandardCatalogsMixin,
+    TestCatalogMixin,
+)
 from users.models import User
 
 TEST_COMPONENT_JSON_BLOB = {
@@ -67,22 +72,77 @@ TEST_COMPONENT_JSON_BLOB = {
     }
 }
 
+# The controls the Component pre_save signal would add, for components made with bulk_create.
+TEST_COMPONENT_CONTROLS = ComponentTools(TEST_COMPONENT_JSON_BLOB).get_control_ids()
+
+
+class ProjectFixtureMixin(TestCatalogMixin):
+    """Create the "Pretty Ordinary Project" on the test catalog with two components.
+
+    The components replace the project's default "This System" component unless
+    keep_default_component is set.
+    """
+
+    keep_default_component = False
 
-class ProjectModelTest(TestCase):
     @classmethod
     def setUpTestData(cls):
-        user = User.objects.create()
-        cls.user = user
+        super().setUpTestData()
+        test_user = User.objects.create(username="creator", password="!")
 
-        call_command(
-            "load_catalog",
-            name="NIST Test Catalog",
-            catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Catalog.ImpactLevel.LOW,
+        test_components = Component.objects.bulk_create(
+            [
+                Component(
+                    title="Cool Component",
+                    description="Probably the coolest component you ever did see. It's magical.",
+                    supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
+                    search_terms=["cool", "magic", "software"],
+                    type="software",
+                    component_json=TEST_COMPONENT_JSON_BLOB,
+                    controls=TEST_COMPONENT_CONTROLS,
+                ),
+                Component(
+                    title="New Cool Component",
+                    description="Probably the coolest component you ever did see. It's magical.",
+                    supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
+                    search_terms=["cool", "magic", "software"],
+                    type="policy",
+                    component_json=TEST_COMPONENT_JSON_BLOB,
+                    controls=TEST_COMPONENT_CONTROLS,
+                ),
+            ]
         )
 
-        test_catalog = Catalog.objects.get(name="NIST Test Catalog")
+        test_project = Project.objects.create(
+            title="Pretty Ordinary Project",
+            acronym="POP",
+            catalog_version=Catalog.Version.NIST_SP80053R5,
+            impact_level=Project.ImpactLevel.LOW,
+            location="other",
+            creator=test_user,
+            catalog=cls.test_catalog,
+        )
+        if cls.keep_default_component:
+            Project.components.through.objects.bulk_create(
+                [
+                    Project.components.through(
+                        project_id=test_project.id, component_id=component.id
+                    )
+                    for component in test_components
+                ]
+            )
+        else:
+            test_project.components.set(test_components)
+
+        cls.test_project = test_project
+
+
+class ProjectModelTest(TestCatalogMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        user = User.objects.create(username="creator", password="!")
+        cls.user = user
 
         cls.test_project = Project.objects.create(
             title="Pretty Ordinary Project",
@@ -91,7 +151,7 @@ class ProjectModelTest(TestCase):
             impact_level=Project.ImpactLevel.LOW,
             location="other",
             creator=user,
-            catalog=test_catalog,
+            catalog=cls.test_catalog,
         )
 
     def test_project_permissions(self):
@@ -109,13 +169,13 @@ class ProjectModelTest(TestCase):
         self.assertEqual(private_component.status, Component.Status.SYSTEM)
 
 
-class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
+class ProjectListCreateViewTestCase(StandardCatalogsMixin, AuthenticatedAPITestCase):
     @classmethod
     def setUpTestData(cls):
-        call_command("load_catalog", load_standard_catalogs=True)
-
-        user = User.objects.create()
-        cls.user = user
+        super().setUpTestData()
+        cls.list_url = reverse("project-list")
+        user = User.objects.create(username="creator", password="!")
+        cls.user, cls.token = user, Token.objects.create(user=user)
 
         project = Project.objects.create(
             creator=user,
@@ -157,18 +217,21 @@ class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
 
         for test in test_cases:
             with self.subTest(test=test):
-                response = self.client.post(
-                    reverse("project-list"),
-                    data=json.dumps(test),
-                    content_type="application/json",
-                )
+                response = self.post_json(self.list_url, test)
                 self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_add_new_project(self):
         # Authenticate as a new user instead of a "super-user"
-        token = Token.objects.create(user=self.user)
-        self.client.force_authenticate(user=self.user, token=token)
+        self.client.force_authenticate(user=self.user, token=self.token)
 
+        catalog_id = (
+            Catalog.objects.only("id")
+            .get(
+                version=Catalog.Version.NIST_SP80053R5,
+                impact_level=Catalog.ImpactLevel.LOW,
+            )
+            .id
+        )
         test_cases = [
             {
                 "title": "Test project",
@@ -176,12 +239,7 @@ class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
                 "catalog_version": Catalog.Version.NIST_SP80053R5,
                 "impact_level": Project.ImpactLevel.LOW,
                 "location": "other",
-                "catalog": (
-                    Catalog.objects.get(
-                        version=Catalog.Version.NIST_SP80053R5,
-                        impact_level=Catalog.ImpactLevel.LOW,
-                    ).id
-                ),
+                "catalog": catalog_id,
             },
             {
                 "title": "Other Test project",
@@ -189,12 +247,7 @@ class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
                 "catalog_version": Catalog.Version.NIST_SP80053R5,
                 "impact_level": Project.ImpactLevel.LOW,
                 "location": "other",
-                "catalog": (
-                    Catalog.objects.get(
-                        version=Catalog.Version.NIST_SP80053R5,
-                        impact_level=Catalog.ImpactLevel.LOW,
-                    ).id
-                ),
+                "catalog": catalog_id,
             },
         ]
 
@@ -202,11 +255,7 @@ class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
             with self.subTest(msg=test_case["title"]):
                 expected_catalog = test_case.pop("catalog")
 
-                response = self.client.post(
-                    reverse("project-list"),
-                    data=json.dumps(test_case),
-                    content_type="application/json",
-                )
+                response = self.post_json(self.list_url, test_case)
                 self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
                 content = response.json()
@@ -221,7 +270,8 @@ class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
                         self.assertEqual(content[field], test_case[field])
 
     def test_project_list_percent_complete(self):
-        response = self.client.get(reverse("project-list"))
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         content = response.json()
@@ -234,62 +284,14 @@ class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
                 self.assertEqual(project["total_controls"], 149)
 
 
-class ProjectComponentsTest(AuthenticatedAPITestCase):
-    @classmethod
-    def setUpTestData(cls):
-        test_user = User.objects.create()
-
-        call_command(
-            "load_catalog",
-            name="NIST Test Catalog",
-            catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Catalog.ImpactLevel.LOW,
-        )
-
-        test_catalog = Catalog.objects.get(name="NIST Test Catalog")
-
-        test_component = Component.objects.create(
-            title="Cool Component",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="software",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-
-        test_component_2 = Component.objects.create(
-            title="Cool Components",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="software",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-
-        test_project = Project.objects.create(
-            title="Pretty Ordinary Project",
-            acronym="POP",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Project.ImpactLevel.LOW,
-            location="other",
-            creator=test_user,
-            catalog=test_catalog,
-        )
-
-        test_project.components.set(
-            [
-                test_component,
-                test_component_2,
-            ]
-        )
-
-        cls.test_project = test_project
-
+class ProjectComponentsTest(
+    ProjectFixtureMixin, AuthenticatedAPITestCase
+):  # pylint: disable=too-many-ancestors
     def test_get_project_with_components(self):
-        response = self.client.get(
-            reverse("project-detail", kwargs={"project_id": self.test_project.pk})
-        )
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse("project-detail", kwargs={"project_id": self.test_project.pk})
+            )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         received_num_components = len(response.data["components"])
@@ -303,13 +305,19 @@ class ProjectComponentsTest(AuthenticatedAPITestCase):
         self.assertEqual(received_components_count, expected_num_components)
 
 
-class ProjectAddComponentViewTest(AuthenticatedAPITestCase):
+class ProjectAddComponentViewTest(StandardCatalogsMixin, AuthenticatedAPITestCase):
+    load_components = True
+
     @classmethod
     def setUpTestData(cls):
-        test_user = User.objects.create()
+        super().setUpTestData()
+        test_user = User.objects.create(username="creator", password="!")
 
-        call_command("load_catalog", load_standard_catalogs=True)
-        call_command("load_components")
+        # A user with no permissions on the test projects.
+        cls.invalid_perms_user = User.objects.create(
+            username="invalid_perms", password="!"
+        )
+        cls.invalid_perms_token = Token.objects.create(user=cls.invalid_perms_user)
 
         cls.test_project_rev5 = Project.objects.create(
             title="Ordinary Rev 5 Project",
@@ -342,32 +350,33 @@ class ProjectAddComponentViewTest(AuthenticatedAPITestCase):
             component_json=TEST_COMPONENT_JSON_BLOB,
         )
 
+        cls.add_component_url = reverse("project-add-component")
+
         cls.django_test_component = Component.objects.get(
             title="Django"
         )  # Has Rev 4 and Rev 5 implementations
 
     def test_invalid_project(self):
-        resp = self.client.post(
-            "/api/projects/add-component/",
+        resp = self.post_json(
+            self.add_component_url,
             {"component_id": 1, "project_id": 0},
         )
         self.assertEqual(resp.status_code, 404)
 
     def test_invalid_project_permissions(self):
-        user, _ = User.objects.get_or_create(username="invalid_perms")
-        token, _ = Token.objects.get_or_create(user=user)
-
-        self.client.force_authenticate(user=user, token=token)
+        self.client.force_authenticate(
+            user=self.invalid_perms_user, token=self.invalid_perms_token
+        )
 
-        resp = self.client.post(
-            "/api/projects/add-component/",
+        resp = self.post_json(
+            self.add_component_url,
             {"creator": 0, "component_id": 1, "project_id": self.test_project_rev5.id},
         )
         self.assertEqual(resp.status_code, 404)
 
     def test_invalid_component(self):
-        resp = self.client.post(
-            "/api/projects/add-component/",
+        resp = self.post_json(
+            self.add_component_url,
             {
                 "component_id": 0,
                 "project_id": self.test_project_rev5.id,
@@ -376,8 +385,8 @@ class ProjectAddComponentViewTest(AuthenticatedAPITestCase):
         self.assertEqual(resp.status_code, 404)
 
     def test_different_catalog(self):
-        resp = self.client.post(
-            "/api/projects/add-component/",
+        resp = self.post_json(
+            self.add_component_url,
             {
                 "component_id": self.test_component_rev4.id,  # Defined with Rev 4 support only
                 "project_id": self.test_project_rev5.id,  # Defined on Rev 5 catalog
@@ -386,8 +395,8 @@ class ProjectAddComponentViewTest(AuthenticatedAPITestCase):
         self.assertEqual(resp.status_code, 400)
 
     def test_happy_path(self):
-        resp = self.client.post(
-            "/api/projects/add-component/",
+        resp = self.post_json(
+            self.add_component_url,
             {
                 "component_id": self.test_component_rev5.id,
                 "project_id": self.test_project_rev5.id,
@@ -396,10 +405,10 @@ class ProjectAddComponentViewTest(AuthenticatedAPITestCase):
         self.assertEqual(resp.status_code, 200)
 
     def test_add_multi_implementation_component(self):
-        for project in (self.test_project_rev5.id, self.test_project_rev5.id):
-            with self.subTest(project=project):
-                response = self.client.post(
-                    "/api/projects/add-component/",
+        for project in (self.test_project_rev5.id, self.test_project_rev4.id):
+            with self.subTest(project=project), self.assertNumQueries(3):
+                response = self.post_json(
+                    self.add_component_url,
                     {
                         "component_id": self.django_test_component.id,
                         "project_id": project,
@@ -408,55 +417,11 @@ class ProjectAddComponentViewTest(AuthenticatedAPITestCase):
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
-class ProjectControlPage(AuthenticatedAPITestCase):
-    @classmethod
-    def setUpTestData(cls):
-        test_user = User.objects.create()
-
-        call_command(
-            "load_catalog",
-            name="NIST Test Catalog",
-            catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Catalog.ImpactLevel.LOW,
-        )
-
-        test_catalog = Catalog.objects.get(name="NIST Test Catalog")
-
-        test_component = Component.objects.create(
-            title="Cool Component",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="software",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-
-        test_component_2 = Component.objects.create(
-            title="Cool Components",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="software",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-
-        test_project = Project.objects.create(
-            title="Pretty Ordinary Project",
-            acronym="POP",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Project.ImpactLevel.LOW,
-            location="other",
-            creator=test_user,
-            catalog=test_catalog,
-        )
-
-        test_project.components.add(
-            test_component,
-            test_component_2,
-        )
-
-        cls.test_project = test_project
+class ProjectControlPage(
+    ProjectFixtureMixin, AuthenticatedAPITestCase
+):  # pylint: disable=too-many-ancestors
+    # The control page serializes the project's private (default) component id.
+    keep_default_component = True
 
     def test_get_control_page(self):
         resp = self.client.get(
@@ -471,15 +436,16 @@ class ProjectControlPage(AuthenticatedAPITestCase):
         self.assertEqual(resp.status_code, 200)
 
     def test_get_control_page_data(self):
-        resp = self.client.get(
-            reverse(
-                "project-get-control",
-                kwargs={
-                    "project_id": self.test_project.id,
-                    "control_id": "ac-2",
-                },
+        with self.assertNumQueries(5):
+            resp = self.client.get(
+                reverse(
+                    "project-get-control",
+                    kwargs={
+                        "project_id": self.test_project.id,
+                        "control_id": "ac-2",
+                    },
+                )
             )
-        )
         self.assertIn("catalog_data", resp.data)
         self.assertIn("component_data", resp.data)
         self.assertIn("responsibility", resp.data["component_data"])
@@ -488,115 +454,72 @@ class ProjectControlPage(AuthenticatedAPITestCase):
         self.assertIn("private", resp.data["component_data"]["components"])
 
 
-class ProjectComponentSearchViewTest(AuthenticatedAPITestCase):
+class ProjectComponentSearchViewTest(
+    ProjectFixtureMixin, AuthenticatedAPITestCase
+):  # pylint: disable=too-many-ancestors
     @classmethod
     def setUpTestData(cls):
-        test_user = User.objects.create()
-
-        call_command(
-            "load_catalog",
-            name="NIST Test Catalog",
-            catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Catalog.ImpactLevel.LOW,
-        )
-
-        test_catalog = Catalog.objects.get(name="NIST Test Catalog")
-
-        test_component = Component.objects.create(
-            title="Cool Component",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="software",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-        test_component_2 = Component.objects.create(
-            title="New Cool Component",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="policy",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-        test_project = Project.objects.create(
-            title="Pretty Ordinary Project",
-            acronym="POP",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Project.ImpactLevel.LOW,
-            location="other",
-            creator=test_user,
-            catalog=test_catalog,
-        )
-        test_project.components.set(
-            [
-                test_component,
-                test_component_2,
-            ]
+        super().setUpTestData()
+        cls.search_url = reverse(
+            "component-search", kwargs={"project_id": cls.test_project.id}
         )
 
-        cls.test_project = test_project
-
     def test_search_empty_request(self):
-        resp = self.client.get(
-            "/api/projects/" + str(self.test_project.id) + "/search/", format="json"
-        )
+        resp = self.client.get(self.search_url, format="json")
         self.assertEqual(resp.status_code, 200)
-        self.assertEqual(json.loads(resp.content).get("total_item_count"), 2)
-        self.assertEqual(json.loads(resp.content).get("type_list")[0][0], "policy")
-        self.assertEqual(json.loads(resp.content).get("type_list")[1][0], "software")
+        content = resp.json()
+        self.assertEqual(content.get("total_item_count"), 2)
+        self.assertEqual(content.get("type_list")[0][0], "policy")
+        self.assertEqual(content.get("type_list")[1][0], "software")
 
     def test_search_filter_type_software(self):
         resp = self.client.get(
-            "/api/projects/" + str(self.test_project.id) + "/search/?type=software",
+            f"{self.search_url}?type=software",
             format="json",
         )
         self.assertEqual(resp.status_code, 200)
-        self.assertEqual(
-            json.loads(resp.content).get("components")[0].get("type"), "software"
-        )
-        self.assertEqual(json.loads(resp.content).get("total_item_count"), 1)
+        content = resp.json()
+        self.assertEqual(content.get("components")[0].get("type"), "software")
+        self.assertEqual(content.get("total_item_count"), 1)
 
 
-class ProjectComponentNotAddedListViewTest(AuthenticatedAPITestCase):
+class ProjectComponentNotAddedListViewTest(TestCatalogMixin, AuthenticatedAPITestCase):
     @classmethod
     def setUpTestData(cls):
-        test_user = User.objects.create()
+        super().setUpTestData()
+        test_user = User.objects.create(username="creator", password="!")
 
-        call_command(
-            "load_catalog",
-            name="NIST Test Catalog",
-            catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Catalog.ImpactLevel.LOW,
-        )
-
-        test_catalog = Catalog.objects.get(name="NIST Test Catalog")
-
-        Component.objects.create(
-            title="Cool Component",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="software",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-        Component.objects.create(
-            title="New Cool Component",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="policy",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-        )
-        Component.objects.create(
-            title="private component",
-            description="Probably the coolest component you ever did see. It's magical.",
-            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
-            search_terms=["cool", "magic", "software"],
-            type="policy",
-            component_json=TEST_COMPONENT_JSON_BLOB,
-            status=1,
+        Component.objects.bulk_create(
+            [
+                Component(
+                    title="Cool Component",
+                    description="Probably the coolest component you ever did see. It's magical.",
+                    supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
+                    search_terms=["cool", "magic", "software"],
+                    type="software",
+                    component_json=TEST_COMPONENT_JSON_BLOB,
+                    controls=TEST_COMPONENT_CONTROLS,
+                ),
+                Component(
+                    title="New Cool Component",
+                    description="Probably the coolest component you ever did see. It's magical.",
+                    supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
+                    search_terms=["cool", "magic", "software"],
+                    type="policy",
+                    component_json=TEST_COMPONENT_JSON_BLOB,
+                    controls=TEST_COMPONENT_CONTROLS,
+                ),
+                Component(
+                    title="private component",
+                    description="Probably the coolest component you ever did see. It's magical.",
+                    supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
+                    search_terms=["cool", "magic", "software"],
+                    type="policy",
+                    component_json=TEST_COMPONENT_JSON_BLOB,
+                    status=1,
+                    controls=TEST_COMPONENT_CONTROLS,
+                ),
+            ]
         )
         cls.test_project = Project.objects.create(
             title="Pretty Ordinary Project",
@@ -605,14 +528,15 @@ class ProjectComponentNotAddedListViewTest(AuthenticatedAPITestCase):
             impact_level=Project.ImpactLevel.LOW,
             location="other",
             creator=test_user,
-            catalog=test_catalog,
+            catalog=cls.test_catalog,
+        )
+        cls.not_added_url = reverse(
+            "components-not-in-project", kwargs={"project_id": cls.test_project.id}
         )
 
     def test_private_component_not_returned(self):
-        resp = self.client.get(
-            "/api/projects/" + str(self.test_project.id) + "/components-not-added/",
-            format="json",
-        )
+        with self.assertNumQueries(2):
+            resp = self.client.get(self.not_added_url, format="json")
         self.assertEqual(resp.status_code, 200)
         content = resp.json()
 
@@ -621,17 +545,19 @@ class ProjectComponentNotAddedListViewTest(AuthenticatedAPITestCase):
                 self.assertNotEqual(test.get("title"), "private component")
 
 
-class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
+class RetrieveUpdateProjectControlViewTestCase(
+    StandardCatalogsMixin, AuthenticatedAPITestCase
+):
+    load_components = True
+
     @classmethod
     def setUpTestData(cls):
-        user = User.objects.create()
+        super().setUpTestData()
+        user = User.objects.create(username="creator", password="!")
         token = Token.objects.create(user=user)
 
         cls.user, cls.token = user, token
 
-        call_command("load_catalog", load_standard_catalogs=True)
-        call_command("load_components")
-
         project = Project.objects.create(
             title="Test project",
             acronym="TP",
@@ -641,9 +567,22 @@ class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
             creator=user,
         )
 
-        project.components.set(Component.objects.all())
+        # Link every other component to the project without loading their JSON.
+        Project.components.through.objects.bulk_create(
+            [
+                Project.components.through(
+                    project_id=project.id, component_id=component_id
+                )
+                for component_id in Component.objects.exclude(
+                    used_by_projects=project
+                ).values_list("id", flat=True)
+            ]
+        )
 
         cls.project = project
+        cls.aws_component_id = (
+            Component.objects.only("id").get(title="Amazon Web Services").id
+        )
 
         cls.ac_2_path = reverse(
             "project-get-control",
@@ -727,7 +666,7 @@ class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
 
         response = self.client.patch(
             self.ac_2_path,
-            data=json.dumps({"status": ProjectControl.Status.INCOMPLETE}),
+            data=orjson.dumps({"status": ProjectControl.Status.INCOMPLETE}),
             content_type="application/json",
         )
 
@@ -739,12 +678,12 @@ class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
 
     def test_enable_disable_narrative(self):
         title = "Amazon Web Services"
-        test_component = Component.objects.get(title=title).id
+        test_component = self.aws_component_id
         patch_kwargs = {"path": self.ac_2_path, "content_type": "application/json"}
 
         # Test narrative is disabled
         disable_response = self.client.patch(
-            data=json.dumps({"disable_narratives": [test_component]}), **patch_kwargs
+            data=orjson.dumps({"disable_narratives": [test_component]}), **patch_kwargs
         )
         self.assertEqual(disable_response.status_code, status.HTTP_200_OK)
 
@@ -755,7 +694,7 @@ class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
 
         # Test same narrative is re-enabled
         enable_response = self.client.patch(
-            data=json.dumps({"enable_narratives": [test_component]}), **patch_kwargs
+            data=orjson.dumps({"enable_narratives": [test_component]}), **patch_kwargs
         )
         self.assertEqual(enable_response.status_code, status.HTTP_200_OK)
 
@@ -767,28 +706,61 @@ class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
     def test_invalid_id_returns_400(self):
         response = self.client.patch(
             self.ac_2_path,
-            data=json.dumps({"disable_narratives": [12345]}),
+            data=orjson.dumps({"disable_narratives": [12345]}),
             content_type="application/json",
         )
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
-class ProjectSspDownload(AuthenticatedAPITestCase):
-    @classmethod
-    def setUpTestData(cls):
-        user = User.objects.create()
-        cls.user = user
+# Implements two of the controls in TEST_COMPONENT_JSON_BLOB.
+SHARED_COMPONENT_JSON_BLOB = {
+    "component-definition": {
+        "uuid": "2f8b0c56-5c1e-4d2b-9a43-7f0e1c9b7d21",
+        "metadata": {
+            "title": "Shared Component",
+            "published": "2021-09-04T02:25:34.558932+00:00",
+            "last-modified": "2021-09-04T02:25:34.558936+00:00",
+            "version": "1",
+            "oscal-version": "1.0.0",
+        },
+        "components": [
+            {
+                "uuid": "9c3e7d4a-1b2f-4e8a-8d6c-5a4b3c2d1e0f",
+                "type": "policy",
+                "title": "Shared Component",
+                "description": "This component shares controls with Cool Component.",
+                "control-implementations": [
+                    {
+                        "uuid": "b7a1c2d3-e4f5-4a6b-8c7d-9e0f1a2b3c4d",
+                        "source": "https://raw.githubusercontent.com/NIST/catalog.json",
+                        "description": Catalog.Version.NIST_SP80053R5,
+                        "implemented-requirements": [
+                            {
+                                "uuid": "0d1e2f3a-4b5c-4d6e-8f7a-9b0c1d2e3f4a",
+                                "control-id": "ac-2",
+                                "description": "This component also satisfies a.",
+                            },
+                            {
+                                "uuid": "5e6f7a8b-9c0d-4e1f-8a2b-3c4d5e6f7a8b",
+                                "control-id": "at-1",
+                                "description": "This component also satisfies b.",
+                            },
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+}
 
-        call_command(
-            "load_catalog",
-            name="NIST Test Catalog",
-            catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
-            catalog_version=Catalog.Version.NIST_SP80053R5,
-            impact_level=Catalog.ImpactLevel.LOW,
-        )
 
-        test_catalog = Catalog.objects.get(name="NIST Test Catalog")
+class ProjectSspDownload(TestCatalogMixin, AuthenticatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        user = User.objects.create(username="creator", password="!")
+        cls.user, cls.token = user, Token.objects.create(user=user)
 
         cls.test_component = Component.objects.create(
             title="OCISO",
@@ -798,6 +770,14 @@ class ProjectSspDownload(AuthenticatedAPITestCase):
             type="software",
             component_json=TEST_COMPONENT_JSON_BLOB,
         )
+        cls.shared_component = Component.objects.create(
+            title="Shared",
+            description="Implements some of the OCISO controls",
+            supported_catalog_versions=[Catalog.Version.NIST_SP80053R5],
+            search_terms=[],
+            type="policy",
+            component_json=SHARED_COMPONENT_JSON_BLOB,
+        )
 
         cls.test_project = Project.objects.create(
             title="Pretty Ordinary Project",
@@ -806,12 +786,11 @@ class ProjectSspDownload(AuthenticatedAPITestCase):
             impact_level=Project.ImpactLevel.LOW,
             location="other",
             creator=user,
-            catalog=test_catalog,
+            catalog=cls.test_catalog,
         )
 
     def test_project_ssp_download(self):
-        token = Token.objects.create(user=self.user)
-        self.client.force_authenticate(user=self.user, token=token)
+        self.client.force_authenticate(user=self.user, token=self.token)
 
         response = self.client.get(
             reverse("download-ssp", kwargs={"project_id": self.test_project.pk})
@@ -821,3 +800,47 @@ class ProjectSspDownload(AuthenticatedAPITestCase):
             response.get("Content-Disposition"),
             f'attachment; filename="{self.test_project.title}-ssp.json"',
         )
+
+    def test_project_ssp_content_length_counts_bytes(self):
+        self.test_project.title = "Prôject"
+        self.test_project.save(update_fields=["title"])
+
+        response = self.client.get(
+            reverse("download-ssp", kwargs={"project_id": self.test_project.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertIn("Prôject".encode(), response.content)
+
+    def test_project_ssp_implemented_requirements(self):
+        self.test_project.components.add(self.test_component, self.shared_component)
+
+        response = self.client.get(
+            reverse("download-ssp", kwargs={"project_id": self.test_project.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        ssp = json.loads(response.content)["system-security-plan"]
+        component_uuids = {
+            item["title"]: item["uuid"]
+            for item in ssp["system-implementation"]["components"]
+        }
+        requirements = ssp["control-implementation"]["implemented-requirements"]
+        control_ids = [item["control-id"] for item in requirements]
+
+        # Each control implemented by a component is listed exactly once, with
+        # one entry for every component that implements it.
+        self.assertEqual(sorted(control_ids), ["ac-2", "at-1", "at-2", "at-3", "pe-3"])
+        shared = {"ac-2", "at-1"}
+        for requirement in requirements:
+            control_id = requirement["control-id"]
+            expected = [component_uuids["OCISO"]]
+            if control_id in shared:
+                expected.append(component_uuids["Shared"])
+
+            with self.subTest(control=control_id):
+                self.assertCountEqual(
+                    [item["component-uuid"] for item in requirement["by-components"]],
+                    expected,
+                )
@@ -17,7 +17,6 @@ from blueprintapi.filters import ObjectPermissionsFilter
 from components.filters import ComponentFilter
 from components.models import Component
 from components.serializers import ComponentListBasicSerializer
-from projects.downloads import OscalSSP
 from projects.filters import ProjectControlFilter
 from projects.models import Project, ProjectControl
 from projects.permissions import ProjectControlPermissions
@@ -49,7 +48,10 @@ class ProjectsListViews(generics.ListCreateAPIView):
 
 
 class ProjectsDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = project_queryset
+    # The nested serializer reads the catalog, creator and components of the project.
+    queryset = project_queryset.select_related("catalog", "creator").prefetch_related(
+        "components"
+    )
     serializer_class = ProjectSerializer
     lookup_url_kwarg = "project_id"
 
@@ -58,7 +60,9 @@ class ProjectAddComponentView(generics.GenericAPIView):
     queryset = Project.objects.all()
 
     def post(self, request, *args, **kwargs):
-        project = get_object_or_404(Project, pk=request.data.get("project_id"))
+        project = get_object_or_404(
+            Project.objects.select_related("catalog"), pk=request.data.get("project_id")
+        )
         self.check_object_permissions(request, project)
 
         component_id = int(request.data.get("component_id"))
@@ -210,7 +214,9 @@ class RetrieveUpdateProjectControlView(generics.RetrieveUpdateAPIView):
         self.check_object_permissions(self.request, project)
 
         return get_object_or_404(
-            ProjectControl,
+            ProjectControl.objects.select_related(
+                "project__catalog", "control__catalog"
+            ),
             control__control_id=self.kwargs.get("control_id"),
             project=project,
         )
@@ -233,7 +239,12 @@ class ProjectSspDownloadView(
 
     @action(methods=["get"], detail=True, renderer_classes=(PassthroughRenderer,))
     def download(self, *args, **kwargs):
-        project = get_object_or_404(Project, pk=self.kwargs.get("project_id"))
+        # The SSP model tree is only needed here, so don't build it at URL loading.
+        from projects.downloads import OscalSSP
+
+        project = get_object_or_404(
+            Project.objects.select_related("catalog"), pk=self.kwargs.get("project_id")
+        )
         self.check_object_permissions(self.request, project)
 
         with open("projects/project_extra.json") as read_file:
@@ -1,10 +1,18 @@
 import logging
 
+import orjson
+from django.core.management import call_command
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
+from catalogs.models import Catalog
 from users.models import User
 
+TEST_CATALOG_NAME = "NIST Test Catalog"
+
+# For tests that set real passwords, where the default PBKDF2 rounds dominate the run time.
+FAST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 
 def prevent_request_warnings(original_function):
     """
@@ -32,3 +40,38 @@ class AuthenticatedAPITestCase(APITestCase):
         user, _ = User.objects.get_or_create(username='test', is_superuser=True)
         token, _ = Token.objects.get_or_create(user=user)
         self.client.force_authenticate(user=user, token=token)
+
+    def post_json(self, url, payload):
+        """POST the payload to url as a JSON body."""
+        return self.client.post(
+            url, orjson.dumps(payload), content_type="application/json"
+        )
+
+
+class StandardCatalogsMixin:
+    """Load the standard NIST catalogs in setUpTestData, plus the bundled components if load_components."""
+
+    load_components = False
+
+    @classmethod
+    def setUpTestData(cls):  # pylint: disable=invalid-name
+        super().setUpTestData()
+        call_command("load_catalog", load_standard_catalogs=True)
+        if cls.load_components:
+            call_command("load_components")
+
+
+class TestCatalogMixin:
+    """Load the small rev 5 test catalog in setUpTestData and expose it as test_catalog."""
+
+    @classmethod
+    def setUpTestData(cls):  # pylint: disable=invalid-name
+        super().setUpTestData()
+        call_command(
+            "load_catalog",
+            name=TEST_CATALOG_NAME,
+            catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
+            catalog_version=Catalog.Version.NIST_SP80053R5,
+            impact_level=Catalog.ImpactLevel.LOW,
+        )
+        cls.test_catalog = Catalog.objects.get(name=TEST_CATALOG_NAME)
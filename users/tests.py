@@ -1,10 +1,15 @@
 import json
 
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from testing_utils import AuthenticatedAPITestCase, prevent_request_warnings
+from testing_utils import (
+    FAST_PASSWORD_HASHERS,
+    AuthenticatedAPITestCase,
+    prevent_request_warnings,
+)
 
 from .models import User
 from .serializers import UserSerializer
@@ -63,6 +68,7 @@ class GetSingleUserTest(AuthenticatedAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class CreateNewUserTest(APITestCase):
     def test_create_valid_user(self):
         valid_payload = {